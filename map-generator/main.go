@@ -9,11 +9,19 @@ import (
 	"path/filepath"
 	"strings"
 	"sync"
+	"time"
 )
 
 // mapsFlag holds the comma-separated list of map names passed via the --maps command-line argument.
 var mapsFlag string
 
+// skipUnchangedFlag is set by the --skip-unchanged command-line argument.
+// When true, maps whose generated files are newer than their inputs are not regenerated.
+var skipUnchangedFlag bool
+
+// outputFiles lists the files processMap writes into each map's output directory.
+var outputFiles = []string{"map.bin", "map4x.bin", "map16x.bin", "thumbnail.webp", "manifest.json"}
+
 // maps defines the registry of available maps to be processed.
 // Each entry contains the folder name and a flag indicating if it's a test map.
 //
@@ -108,13 +116,20 @@ func processMap(name string, isTest bool) error {
 	}
 
 	inputPath := filepath.Join(inputMapDir, name, "image.png")
+	manifestPath := filepath.Join(inputMapDir, name, "info.json")
+	mapDir := filepath.Join(outputMapBaseDir, name)
+
+	if skipUnchangedFlag && outputsUpToDate([]string{inputPath, manifestPath}, mapDir) {
+		log.Printf("Skipping Map: %s, outputs are newer than its inputs", name)
+		return nil
+	}
+
 	imageBuffer, err := os.ReadFile(inputPath)
 	if err != nil {
 		return fmt.Errorf("failed to read map file %s: %w", inputPath, err)
 	}
 
 	// Read the info.json file
-	manifestPath := filepath.Join(inputMapDir, name, "info.json")
 	manifestBuffer, err := os.ReadFile(manifestPath)
 	if err != nil {
 		return fmt.Errorf("failed to read info file %s: %w", manifestPath, err)
@@ -152,7 +167,6 @@ func processMap(name string, isTest bool) error {
 		"num_land_tiles": result.Map16x.NumLandTiles,
 	}
 
-	mapDir := filepath.Join(outputMapBaseDir, name)
 	if err := os.MkdirAll(mapDir, 0755); err != nil {
 		return fmt.Errorf("failed to create output directory for %s: %w", name, err)
 	}
@@ -181,6 +195,30 @@ func processMap(name string, isTest bool) error {
 	return nil
 }
 
+// outputsUpToDate reports whether every file in outputFiles exists in mapDir and was
+// modified no earlier than the newest of the input files.
+// It only compares modification times, so changes to the generator itself are not detected.
+func outputsUpToDate(inputs []string, mapDir string) bool {
+	var newestInput time.Time
+	for _, input := range inputs {
+		info, err := os.Stat(input)
+		if err != nil {
+			return false
+		}
+		if info.ModTime().After(newestInput) {
+			newestInput = info.ModTime()
+		}
+	}
+
+	for _, output := range outputFiles {
+		info, err := os.Stat(filepath.Join(mapDir, output))
+		if err != nil || info.ModTime().Before(newestInput) {
+			return false
+		}
+	}
+	return true
+}
+
 // parseMapsFlag validates and parses the --maps command-line argument.
 // It returns a set of selected map names or nil if no flag was provided (implying all maps).
 func parseMapsFlag() (map[string]bool, error) {
@@ -246,6 +284,7 @@ func loadTerrainMaps() error {
 // It parses flags and triggers the map generation process.
 func main() {
 	flag.StringVar(&mapsFlag, "maps", "", "optional comma-separated list of maps to process. ex: --maps=world,eastasia,big_plains")
+	flag.BoolVar(&skipUnchangedFlag, "skip-unchanged", false, "skip maps whose generated files are newer than their image.png and info.json")
 	flag.Parse()
 
 	if err := loadTerrainMaps(); err != nil {
@@ -4,10 +4,11 @@ import (
 	"bytes"
 	"fmt"
 	"image"
-	"image/color"
 	"image/png"
 	"log"
 	"math"
+	"runtime"
+	"sync"
 
 	"github.com/chai2010/webp"
 )
@@ -30,8 +31,12 @@ type Coord struct {
 	X, Y int
 }
 
+// neighborOffsets are the steps to the adjacent tiles (left, right, up, down) visited
+// by the flood fills. Shared so the searches don't build a fresh slice per tile.
+var neighborOffsets = [4]Coord{{-1, 0}, {1, 0}, {0, -1}, {0, 1}}
+
 // TerrainType represents the classification of a map tile (e.g., Land or Water).
-type TerrainType int
+type TerrainType uint8
 
 // Enumeration of possible TerrainType values.
 const (
@@ -41,11 +46,14 @@ const (
 
 // Terrain represents the properties of a single map tile.
 // Magnitude represents elevation for Land (0-30) or distance to land for Water.
+//
+// The small fields are grouped ahead of Magnitude so a tile packs into 16 bytes;
+// the generator holds several full-size grids of these at once.
 type Terrain struct {
 	Type      TerrainType
 	Shoreline bool
-	Magnitude float64
 	Ocean     bool
+	Magnitude float64
 }
 
 // MapResult is the output format from the GenerateMap workflow
@@ -110,32 +118,9 @@ func GenerateMap(args GeneratorArgs) (MapResult, error) {
 	log.Printf("Processing Map: %s, dimensions: %dx%d", args.Name, width, height)
 
 	// Initialize terrain grid
-	terrain := make([][]Terrain, width)
-	for x := range terrain {
-		terrain[x] = make([]Terrain, height)
-	}
-
-	// Process each pixel
-	for x := 0; x < width; x++ {
-		for y := 0; y < height; y++ {
-			_, _, b, a := img.At(x, y).RGBA()
-			// Convert from 16-bit to 8-bit values
-			alpha := uint8(a >> 8)
-			blue := uint8(b >> 8)
-
-			if alpha < 20 || blue == 106 {
-				// Transparent or specific blue value = water
-				terrain[x][y] = Terrain{Type: Water}
-			} else {
-				// Land
-				terrain[x][y] = Terrain{Type: Land}
+	terrain := newGrid[Terrain](width, height)
 
-				// Calculate magnitude from blue channel (140-200 range)
-				mag := math.Min(200, math.Max(140, float64(blue))) - 140
-				terrain[x][y].Magnitude = mag / 2
-			}
-		}
-	}
+	decodeTerrain(img, terrain)
 
 	removeSmallIslands(terrain, args.RemoveSmall)
 	processWater(terrain, args.RemoveSmall)
@@ -183,18 +168,168 @@ func GenerateMap(args GeneratorArgs) (MapResult, error) {
 	}, nil
 }
 
+// newGrid allocates a zeroed width x height grid indexed [x][y].
+// All columns share a single backing array, so a grid costs two allocations rather
+// than one per column, and neighboring columns stay adjacent in memory.
+func newGrid[T any](width, height int) [][]T {
+	cells := make([]T, width*height)
+	grid := make([][]T, width)
+	for x := range grid {
+		grid[x] = cells[x*height : (x+1)*height : (x+1)*height]
+	}
+	return grid
+}
+
+// decodeTerrain fills the terrain grid from the pixels of the source image.
+// Common PNG layouts are read straight from their pixel buffers; other image
+// types fall back to the generic (and much slower) img.At color conversion.
+// Pixel buffers are walked tile by tile, see forEachTile.
+func decodeTerrain(img image.Image, terrain [][]Terrain) {
+	width := len(terrain)
+	height := len(terrain[0])
+
+	switch src := img.(type) {
+	case *image.NRGBA:
+		forEachTile(width, height, func(x0, y0, x1, y1 int) {
+			for y := y0; y < y1; y++ {
+				for x := x0; x < x1; x++ {
+					i := src.PixOffset(x, y)
+					alpha := src.Pix[i+3]
+					// Premultiply blue by alpha, matching what img.At(x, y).RGBA() returns
+					blue := uint8(uint32(src.Pix[i+2]) * 0x101 * uint32(alpha) / 0xff >> 8)
+					terrain[x][y] = terrainFromPixel(blue, alpha)
+				}
+			}
+		})
+	case *image.NRGBA64:
+		// 16-bit channels are stored big-endian, two bytes each
+		forEachTile(width, height, func(x0, y0, x1, y1 int) {
+			for y := y0; y < y1; y++ {
+				for x := x0; x < x1; x++ {
+					i := src.PixOffset(x, y)
+					blue := uint32(src.Pix[i+4])<<8 | uint32(src.Pix[i+5])
+					alpha := uint32(src.Pix[i+6])<<8 | uint32(src.Pix[i+7])
+					// Premultiply blue by alpha, matching what img.At(x, y).RGBA() returns
+					blue = blue * alpha / 0xffff
+					terrain[x][y] = terrainFromPixel(uint8(blue>>8), uint8(alpha>>8))
+				}
+			}
+		})
+	case *image.RGBA:
+		forEachTile(width, height, func(x0, y0, x1, y1 int) {
+			for y := y0; y < y1; y++ {
+				for x := x0; x < x1; x++ {
+					i := src.PixOffset(x, y)
+					terrain[x][y] = terrainFromPixel(src.Pix[i+2], src.Pix[i+3])
+				}
+			}
+		})
+	case *image.Gray:
+		// Grayscale maps are opaque and their blue value is the luminance
+		forEachTile(width, height, func(x0, y0, x1, y1 int) {
+			for y := y0; y < y1; y++ {
+				for x := x0; x < x1; x++ {
+					terrain[x][y] = terrainFromPixel(src.Pix[src.PixOffset(x, y)], 0xff)
+				}
+			}
+		})
+	case *image.Paletted:
+		// Resolve each palette entry once instead of converting its color per pixel
+		palette := make([]Terrain, len(src.Palette))
+		for i, c := range src.Palette {
+			_, _, b, a := c.RGBA()
+			palette[i] = terrainFromPixel(uint8(b>>8), uint8(a>>8))
+		}
+		forEachTile(width, height, func(x0, y0, x1, y1 int) {
+			for y := y0; y < y1; y++ {
+				for x := x0; x < x1; x++ {
+					terrain[x][y] = palette[src.Pix[src.PixOffset(x, y)]]
+				}
+			}
+		})
+	default:
+		for x := 0; x < width; x++ {
+			for y := 0; y < height; y++ {
+				_, _, b, a := img.At(x, y).RGBA()
+				// Convert from 16-bit to 8-bit values
+				terrain[x][y] = terrainFromPixel(uint8(b>>8), uint8(a>>8))
+			}
+		}
+	}
+}
+
+// tileSize is the edge length of the square blocks walked by forEachTile.
+// 32 measured fastest decoding giantworldmap; larger blocks start spilling L1/L2.
+const tileSize = 32
+
+// forEachTile calls fn with the bounds [x0, x1) x [y0, y1) of each tileSize block
+// covering a width x height grid.
+//
+// The terrain grid is indexed [x][y] (column-major) while image pixel buffers are
+// row-major, so a plain nested loop strides through one of them on every step.
+// Walking block by block keeps the rows and columns being touched in cache.
+//
+// The grid is split into vertical bands of whole tiles that are processed
+// concurrently, one goroutine per available CPU. fn must therefore be safe to call
+// concurrently for disjoint blocks.
+func forEachTile(width, height int, fn func(x0, y0, x1, y1 int)) {
+	workers := runtime.GOMAXPROCS(0)
+	tileCols := (width + tileSize - 1) / tileSize
+	bandWidth := max((tileCols+workers-1)/workers, 1) * tileSize
+
+	var wg sync.WaitGroup
+	for bandX := 0; bandX < width; bandX += bandWidth {
+		wg.Add(1)
+		go func(bandX0, bandX1 int) {
+			defer wg.Done()
+			for x0 := bandX0; x0 < bandX1; x0 += tileSize {
+				x1 := min(x0+tileSize, bandX1)
+				for y0 := 0; y0 < height; y0 += tileSize {
+					y1 := min(y0+tileSize, height)
+					fn(x0, y0, x1, y1)
+				}
+			}
+		}(bandX, min(bandX+bandWidth, width))
+	}
+	wg.Wait()
+}
+
+// landMagnitudes maps every possible blue value to the Magnitude of a Land tile.
+// Blue only has 256 values, so the clamp and scale are computed once up front.
+var landMagnitudes = func() (lut [256]float64) {
+	for blue := range lut {
+		// Calculate magnitude from blue channel (140-200 range)
+		mag := math.Min(200, math.Max(140, float64(blue))) - 140
+		lut[blue] = mag / 2
+	}
+	return lut
+}()
+
+// terrainFromPixel maps the 8-bit blue and alpha values of a pixel to a Terrain tile.
+// See GenerateMap for the full mapping table.
+func terrainFromPixel(blue, alpha uint8) Terrain {
+	if alpha < 20 || blue == 106 {
+		// Transparent or specific blue value = water
+		return Terrain{Type: Water}
+	}
+
+	return Terrain{Type: Land, Magnitude: landMagnitudes[blue]}
+}
+
 // convertToWebP encodes raw RGBA thumbnail data into WebP format.
 func convertToWebP(thumb ThumbData) ([]byte, error) {
-	// Create RGBA image from raw data
-	img := image.NewRGBA(image.Rect(0, 0, thumb.Width, thumb.Height))
-
-	// Copy the raw RGBA data
 	if len(thumb.Data) != thumb.Width*thumb.Height*4 {
 		return nil, fmt.Errorf("invalid thumb data length: expected %d, got %d",
 			thumb.Width*thumb.Height*4, len(thumb.Data))
 	}
 
-	copy(img.Pix, thumb.Data)
+	// Wrap the raw data as an RGBA image in place; it is already tightly packed
+	// RGBA rows, so there is no need to allocate and copy a second buffer
+	img := &image.RGBA{
+		Pix:    thumb.Data,
+		Stride: thumb.Width * 4,
+		Rect:   image.Rect(0, 0, thumb.Width, thumb.Height),
+	}
 
 	// Encode as WebP with quality 45 (equivalent to the JavaScript version)
 	webpData, err := webp.EncodeRGBA(img, 45)
@@ -216,22 +351,25 @@ func createMiniMap(tm [][]Terrain) [][]Terrain {
 	miniWidth := width / 2
 	miniHeight := height / 2
 
-	miniMap := make([][]Terrain, miniWidth)
-	for x := range miniMap {
-		miniMap[x] = make([]Terrain, miniHeight)
-	}
-
-	for x := 0; x < width; x++ {
-		for y := 0; y < height; y++ {
-			miniX := x / 2
-			miniY := y / 2
-
-			if miniX < miniWidth && miniY < miniHeight {
-				// If any of the 4 tiles has water, mini tile is water
-				if miniMap[miniX][miniY].Type != Water {
-					miniMap[miniX][miniY] = tm[x][y]
-				}
+	miniMap := newGrid[Terrain](miniWidth, miniHeight)
+
+	// Visit each mini tile once and pick its source tile from the 2x2 block,
+	// rather than overwriting it from up to four source tiles
+	for x := 0; x < miniWidth; x++ {
+		left, right := tm[2*x], tm[2*x+1]
+		for y := 0; y < miniHeight; y++ {
+			// If any of the 4 tiles has water, mini tile is water (the first in
+			// column order); otherwise it takes the bottom right tile
+			tile := right[2*y+1]
+			switch {
+			case left[2*y].Type == Water:
+				tile = left[2*y]
+			case left[2*y+1].Type == Water:
+				tile = left[2*y+1]
+			case right[2*y].Type == Water:
+				tile = right[2*y]
 			}
+			miniMap[x][y] = tile
 		}
 	}
 
@@ -251,24 +389,17 @@ func processShore(terrain [][]Terrain) []Coord {
 	for x := 0; x < width; x++ {
 		for y := 0; y < height; y++ {
 			tile := &terrain[x][y]
-			neighbors := getNeighbors(x, y, terrain)
 
 			if tile.Type == Land {
 				// Land tile adjacent to water is shoreline
-				for _, n := range neighbors {
-					if n.Type == Water {
-						tile.Shoreline = true
-						break
-					}
+				if hasNeighborOfType(x, y, terrain, Water) {
+					tile.Shoreline = true
 				}
 			} else {
 				// Water tile adjacent to land is shoreline
-				for _, n := range neighbors {
-					if n.Type == Land {
-						tile.Shoreline = true
-						shorelineWaters = append(shorelineWaters, Coord{X: x, Y: y})
-						break
-					}
+				if hasNeighborOfType(x, y, terrain, Land) {
+					tile.Shoreline = true
+					shorelineWaters = append(shorelineWaters, Coord{X: x, Y: y})
 				}
 			}
 		}
@@ -280,82 +411,56 @@ func processShore(terrain [][]Terrain) []Coord {
 // processDistToLand calculates the distance of water tiles from the nearest land.
 // It uses a Breadth-First Search (BFS) starting from the shoreline water tiles.
 // The distance is stored in the Magnitude field of the Water tiles.
+// shorelineWaters is used as the BFS queue and appended to.
 func processDistToLand(shorelineWaters []Coord, terrain [][]Terrain) {
 	log.Println("Setting Water tiles magnitude = Manhattan distance from nearest land")
 
 	width := len(terrain)
 	height := len(terrain[0])
 
-	visited := make([][]bool, width)
-	for x := range visited {
-		visited[x] = make([]bool, height)
-	}
-
-	type queueItem struct {
-		x, y, dist int
-	}
-
-	queue := make([]queueItem, 0)
+	visited := newGrid[bool](width, height)
 
-	// Initialize queue with shoreline waters
-	for _, coord := range shorelineWaters {
-		queue = append(queue, queueItem{x: coord.X, y: coord.Y, dist: 0})
+	// The shoreline waters seed the BFS and the slice doubles as its queue. Each
+	// queued tile already holds its distance in Magnitude, so no separate queue
+	// entries are built. Walk it with a head index rather than re-slicing
+	// queue[1:], which discards capacity on every pop and makes appends
+	// reallocate far more often.
+	queue := shorelineWaters
+	for _, coord := range queue {
 		visited[coord.X][coord.Y] = true
 		terrain[coord.X][coord.Y].Magnitude = 0
 	}
 
-	directions := []Coord{{0, 1}, {1, 0}, {0, -1}, {-1, 0}}
+	for head := 0; head < len(queue); head++ {
+		current := queue[head]
+		dist := terrain[current.X][current.Y].Magnitude + 1
 
-	for len(queue) > 0 {
-		current := queue[0]
-		queue = queue[1:]
-
-		for _, dir := range directions {
-			nx := current.x + dir.X
-			ny := current.y + dir.Y
+		for _, dir := range neighborOffsets {
+			nx := current.X + dir.X
+			ny := current.Y + dir.Y
 
 			if nx >= 0 && ny >= 0 && nx < width && ny < height &&
 				!visited[nx][ny] && terrain[nx][ny].Type == Water {
 
 				visited[nx][ny] = true
-				terrain[nx][ny].Magnitude = float64(current.dist + 1)
-				queue = append(queue, queueItem{x: nx, y: ny, dist: current.dist + 1})
+				terrain[nx][ny].Magnitude = dist
+				queue = append(queue, Coord{X: nx, Y: ny})
 			}
 		}
 	}
 }
 
-// getNeighbors returns a list of Terrain tiles adjacent to the specified coordinates.
-func getNeighbors(x, y int, terrain [][]Terrain) []Terrain {
-	coords := getNeighborCoords(x, y, terrain)
-	neighbors := make([]Terrain, len(coords))
-	for i, coord := range coords {
-		neighbors[i] = terrain[coord.X][coord.Y]
-	}
-	return neighbors
-}
-
-// getNeighborCoords returns a list of valid adjacent coordinates (up, down, left, right).
-// It ensures that the returned coordinates are within the bounds of the terrain grid.
-func getNeighborCoords(x, y int, terrain [][]Terrain) []Coord {
+// hasNeighborOfType reports whether any tile adjacent (up, down, left, right) to the
+// specified coordinates has the given TerrainType.
+// It reads the neighbors in place, without allocating a slice of them per tile.
+func hasNeighborOfType(x, y int, terrain [][]Terrain, terrainType TerrainType) bool {
 	width := len(terrain)
 	height := len(terrain[0])
-	var coords []Coord
-
-	if x > 0 {
-		coords = append(coords, Coord{X: x - 1, Y: y})
-	}
-	if x < width-1 {
-		coords = append(coords, Coord{X: x + 1, Y: y})
-	}
-	if y > 0 {
-		coords = append(coords, Coord{X: x, Y: y - 1})
-	}
-	if y < height-1 {
-		coords = append(coords, Coord{X: x, Y: y + 1})
-	}
 
-	return coords
+	return (x > 0 && terrain[x-1][y].Type == terrainType) ||
+		(x < width-1 && terrain[x+1][y].Type == terrainType) ||
+		(y > 0 && terrain[x][y-1].Type == terrainType) ||
+		(y < height-1 && terrain[x][y+1].Type == terrainType)
 }
 
 // processWater identifies and processes bodies of water in the terrain.
@@ -364,59 +469,34 @@ func getNeighborCoords(x, y int, terrain [][]Terrain) []Coord {
 // Finally, it triggers shoreline identification and distance-to-land calculations.
 func processWater(terrain [][]Terrain, removeSmall bool) {
 	log.Println("Processing water bodies")
-	visited := make(map[string]bool)
-
-	type waterBody struct {
-		coords []Coord
-		size   int
-	}
-
-	var waterBodies []waterBody
-
-	// Find all distinct water bodies
-	for x := 0; x < len(terrain); x++ {
-		for y := 0; y < len(terrain[0]); y++ {
-			if terrain[x][y].Type == Water {
-				key := fmt.Sprintf("%d,%d", x, y)
-				if visited[key] {
-					continue
-				}
-
-				coords := getArea(x, y, terrain, visited)
-				waterBodies = append(waterBodies, waterBody{
-					coords: coords,
-					size:   len(coords),
-				})
-			}
-		}
-	}
 
-	// Sort by size (largest first)
-	for i := 0; i < len(waterBodies)-1; i++ {
-		for j := i + 1; j < len(waterBodies); j++ {
-			if waterBodies[j].size > waterBodies[i].size {
-				waterBodies[i], waterBodies[j] = waterBodies[j], waterBodies[i]
-			}
+	// Find all distinct water bodies, tracking the largest (first found wins ties)
+	var waterBodies [][]Coord
+	largest := 0
+	forEachArea(terrain, Water, func(area []Coord) {
+		if len(waterBodies) > 0 && len(area) > len(waterBodies[largest]) {
+			largest = len(waterBodies)
 		}
-	}
+		waterBodies = append(waterBodies, area)
+	})
 
 	smallLakes := 0
 
 	if len(waterBodies) > 0 {
 		// Mark largest water body as ocean
-		largestWaterBody := waterBodies[0]
-		for _, coord := range largestWaterBody.coords {
+		largestWaterBody := waterBodies[largest]
+		for _, coord := range largestWaterBody {
 			terrain[coord.X][coord.Y].Ocean = true
 		}
-		log.Printf("Identified ocean with %d water tiles", largestWaterBody.size)
+		log.Printf("Identified ocean with %d water tiles", len(largestWaterBody))
 
 		if removeSmall {
 			// Remove small water bodies
 			log.Println("Searching for small water bodies for removal")
-			for w := 1; w < len(waterBodies); w++ {
-				if waterBodies[w].size < minLakeSize {
+			for w, body := range waterBodies {
+				if w != largest && len(body) < minLakeSize {
 					smallLakes++
-					for _, coord := range waterBodies[w].coords {
+					for _, coord := range body {
 						terrain[coord.X][coord.Y].Type = Land
 						terrain[coord.X][coord.Y].Magnitude = 0
 					}
@@ -434,29 +514,50 @@ func processWater(terrain [][]Terrain, removeSmall bool) {
 	}
 }
 
+// forEachArea calls fn with the coordinates of every contiguous area of tiles of the
+// given TerrainType, in the order the areas are found.
+// It is shared by the island and water body passes, and tracks visited tiles in a
+// grid rather than a map so no per-tile allocations are needed.
+// fn may modify the tiles of the area it is passed.
+func forEachArea(terrain [][]Terrain, targetType TerrainType, fn func(area []Coord)) {
+	width := len(terrain)
+	height := len(terrain[0])
+
+	visited := newGrid[bool](width, height)
+
+	for x := 0; x < width; x++ {
+		for y := 0; y < height; y++ {
+			if terrain[x][y].Type == targetType && !visited[x][y] {
+				fn(getArea(x, y, terrain, visited))
+			}
+		}
+	}
+}
+
 // getArea performs a Breadth-First Search (BFS) to find a contiguous area of tiles
 // sharing the same TerrainType as the passed x,y coordinates.
-// The visited map is updated to prevent reprocessing tiles.
-func getArea(x, y int, terrain [][]Terrain, visited map[string]bool) []Coord {
+// The visited grid is updated to prevent reprocessing tiles.
+func getArea(x, y int, terrain [][]Terrain, visited [][]bool) []Coord {
+	width := len(terrain)
+	height := len(terrain[0])
 	targetType := terrain[x][y].Type
-	var area []Coord
-	queue := []Coord{{X: x, Y: y}}
+	visited[x][y] = true
+	area := []Coord{{X: x, Y: y}}
 
-	for len(queue) > 0 {
-		coord := queue[0]
-		queue = queue[1:]
+	// The area doubles as the BFS queue. Each tile is checked once, when it is
+	// first discovered, and only tiles belonging to the area are ever queued.
+	for head := 0; head < len(area); head++ {
+		coord := area[head]
+		for _, dir := range neighborOffsets {
+			nx := coord.X + dir.X
+			ny := coord.Y + dir.Y
 
-		key := fmt.Sprintf("%d,%d", coord.X, coord.Y)
-		if visited[key] {
-			continue
-		}
-		visited[key] = true
-
-		if terrain[coord.X][coord.Y].Type == targetType {
-			area = append(area, coord)
+			if nx >= 0 && ny >= 0 && nx < width && ny < height &&
+				!visited[nx][ny] && terrain[nx][ny].Type == targetType {
 
-			neighborCoords := getNeighborCoords(coord.X, coord.Y, terrain)
-			queue = append(queue, neighborCoords...)
+				visited[nx][ny] = true
+				area = append(area, Coord{X: nx, Y: ny})
+			}
 		}
 	}
 
@@ -470,44 +571,19 @@ func removeSmallIslands(terrain [][]Terrain, removeSmall bool) {
 		return
 	}
 
-	visited := make(map[string]bool)
-
-	type landBody struct {
-		coords []Coord
-		size   int
-	}
-
-	var landBodies []landBody
-
-	// Find all distinct land bodies
-	for x := 0; x < len(terrain); x++ {
-		for y := 0; y < len(terrain[0]); y++ {
-			if terrain[x][y].Type == Land {
-				key := fmt.Sprintf("%d,%d", x, y)
-				if visited[key] {
-					continue
-				}
-
-				coords := getArea(x, y, terrain, visited)
-				landBodies = append(landBodies, landBody{
-					coords: coords,
-					size:   len(coords),
-				})
-			}
-		}
-	}
-
 	smallIslands := 0
 
-	for _, body := range landBodies {
-		if body.size < minIslandSize {
+	// Remove small land bodies as they are found instead of collecting every body
+	// (continents included) first and walking the list again
+	forEachArea(terrain, Land, func(body []Coord) {
+		if len(body) < minIslandSize {
 			smallIslands++
-			for _, coord := range body.coords {
+			for _, coord := range body {
 				terrain[coord.X][coord.Y].Type = Water
 				terrain[coord.X][coord.Y].Magnitude = 0
 			}
 		}
-	}
+	})
 
 	log.Printf("Identified and removed %d islands smaller than %d tiles",
 		smallIslands, minIslandSize)
@@ -530,11 +606,15 @@ func packTerrain(terrain [][]Terrain) (data []byte, numLandTiles int) {
 	for x := 0; x < width; x++ {
 		for y := 0; y < height; y++ {
 			tile := terrain[x][y]
-			var packedByte byte = 0
+			var packedByte byte
 
+			// The terrain type sets bit 7 and picks the magnitude scale, so
+			// branch on it once
 			if tile.Type == Land {
-				packedByte |= 0b10000000
+				packedByte = 0b10000000 | byte(math.Min(math.Ceil(tile.Magnitude), 31))
 				numLandTiles++
+			} else {
+				packedByte = byte(math.Min(math.Ceil(tile.Magnitude/2), 31))
 			}
 			if tile.Shoreline {
 				packedByte |= 0b01000000
@@ -543,12 +623,6 @@ func packTerrain(terrain [][]Terrain) (data []byte, numLandTiles int) {
 				packedByte |= 0b00100000
 			}
 
-			if tile.Type == Land {
-				packedByte |= byte(math.Min(math.Ceil(tile.Magnitude), 31))
-			} else {
-				packedByte |= byte(math.Min(math.Ceil(tile.Magnitude/2), 31))
-			}
-
 			packedData[y*width+x] = packedByte
 		}
 	}
@@ -571,17 +645,27 @@ func createMapThumbnail(terrain [][]Terrain, quality float64) *image.RGBA {
 
 	img := image.NewRGBA(image.Rect(0, 0, targetWidth, targetHeight))
 
-	for x := 0; x < targetWidth; x++ {
-		for y := 0; y < targetHeight; y++ {
-			srcX := int(math.Floor(float64(x) / quality))
-			srcY := int(math.Floor(float64(y) / quality))
-
-			srcX = int(math.Min(float64(srcX), float64(srcWidth-1)))
-			srcY = int(math.Min(float64(srcY), float64(srcHeight-1)))
+	// The source row only depends on y, so map it once rather than per pixel
+	srcYs := make([]int, targetHeight)
+	for y := range srcYs {
+		srcY := int(math.Floor(float64(y) / quality))
+		srcYs[y] = int(math.Min(float64(srcY), float64(srcHeight-1)))
+	}
 
-			terrain := terrain[srcX][srcY]
-			rgba := getThumbnailColor(terrain)
-			img.Set(x, y, color.RGBA{R: rgba.R, G: rgba.G, B: rgba.B, A: rgba.A})
+	for x := 0; x < targetWidth; x++ {
+		srcX := int(math.Floor(float64(x) / quality))
+		srcX = int(math.Min(float64(srcX), float64(srcWidth-1)))
+
+		for y, srcY := range srcYs {
+			rgba := thumbnailColor(terrain[srcX][srcY])
+
+			// Write the pixel straight into the buffer; img.Set would box the
+			// color in an interface and run it through the color model
+			i := img.PixOffset(x, y)
+			img.Pix[i+0] = rgba.R
+			img.Pix[i+1] = rgba.G
+			img.Pix[i+2] = rgba.B
+			img.Pix[i+3] = rgba.A
 		}
 	}
 
@@ -594,6 +678,37 @@ type RGBA struct {
 	R, G, B, A uint8
 }
 
+// landThumbnailColors and waterThumbnailColors hold getThumbnailColor for the
+// magnitudes non-shoreline tiles take in practice: Land elevation moves in half steps
+// from 0 to 30 (see landMagnitudes) and Water distance in whole steps, with the Water
+// color no longer changing past a distance of 20.
+var landThumbnailColors, waterThumbnailColors = func() (land [61]RGBA, water [21]RGBA) {
+	for i := range land {
+		land[i] = getThumbnailColor(Terrain{Type: Land, Magnitude: float64(i) / 2})
+	}
+	for i := range water {
+		water[i] = getThumbnailColor(Terrain{Type: Water, Magnitude: float64(i)})
+	}
+	return land, water
+}()
+
+// thumbnailColor returns the same color as getThumbnailColor, looking it up in the
+// precomputed tables when the tile's magnitude is one of their entries.
+func thumbnailColor(t Terrain) RGBA {
+	if !t.Shoreline {
+		if t.Type == Land {
+			if i := t.Magnitude * 2; i >= 0 && i < float64(len(landThumbnailColors)) && i == math.Trunc(i) {
+				return landThumbnailColors[int(i)]
+			}
+		} else {
+			if i := math.Min(t.Magnitude, float64(len(waterThumbnailColors)-1)); i >= 0 && i == math.Trunc(i) {
+				return waterThumbnailColors[int(i)]
+			}
+		}
+	}
+	return getThumbnailColor(t)
+}
+
 // getThumbnailColor determines the RGBA color for a specific terrain tile for
 // the map preview thumbnail.
 //